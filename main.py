@@ -5,7 +5,7 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 
-from src.data_loader import load_balance_sheet_csv, parse_scenarios_json
+from src.data_loader import load_balance_sheet_cached, parse_scenarios_json
 from src.balance_sheet_logic import BalanceSheetCombiner, format_balance_sheet
 from src.scenario_manager import ScenarioManager
 from src.adjustments import AcquisitionAdjustments, create_acquisition_config
@@ -16,6 +16,14 @@ def parse_arguments():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description='M&A Model - Balance Sheet Consolidation')
     
+    parser.add_argument(
+        '--mode',
+        choices=['load', 'combine', 'scenarios', 'workflow'],
+        default='workflow',
+        help='Stage to run: validate inputs, combine balance sheets, '
+             'list scenarios, or run the full consolidation workflow'
+    )
+    
     parser.add_argument(
         '--balance-sheet',
         type=str,
@@ -44,6 +52,20 @@ def parse_arguments():
         help='Interest rate for debt financing'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Number of worker processes for writing scenario workbooks (0 for one per CPU)'
+    )
+    
+    parser.add_argument(
+        '--excel-engine',
+        choices=['xlsxwriter', 'pyexcelerate'],
+        default='xlsxwriter',
+        help='Writer used for the consolidated balance sheet workbooks'
+    )
+    
     parser.add_argument(
         '--chart-type',
         choices=['plotly', 'matplotlib'],
@@ -58,12 +80,9 @@ def main():
     # Parse command line arguments
     args = parse_arguments()
     
-    # Ensure output directory exists
-    Path(args.output_dir).mkdir(parents=True, exist_ok=True)
-    
     print("\nLoading input data...")
     # Load sample balance sheets
-    sample_bs = load_balance_sheet_csv(args.balance_sheet)
+    sample_bs = load_balance_sheet_cached(args.balance_sheet)
     
     # Split into acquirer and target balance sheets
     acquirer_bs = pd.DataFrame({
@@ -80,6 +99,41 @@ def main():
     # Load scenarios
     scenarios_data = parse_scenarios_json(args.scenarios)
     
+    if args.mode == 'load':
+        print(f"\nLoaded {len(sample_bs)} accounts and {len(scenarios_data)} scenarios")
+        print(sample_bs.to_string(index=False))
+        return
+    
+    # Example intercompany balances
+    intercompany_balances = {
+        'Accounts Receivable': 5000,
+        'Accounts Payable': 5000
+    }
+    
+    if args.mode == 'combine':
+        bs_combiner = BalanceSheetCombiner(acquirer_bs, target_bs)
+        combined_bs = format_balance_sheet(
+            bs_combiner.combine_balance_sheets(intercompany_balances)
+        )
+        print("\nCombined Balance Sheet:")
+        print(combined_bs.to_string(index=False))
+        total_assets, total_liab_equity = bs_combiner.combined_totals(combined_bs)
+        print(f"\nTotal Assets: {total_assets:,.2f}")
+        print(f"Total Liabilities & Equity: {total_liab_equity:,.2f}")
+        print(f"Balanced: {bs_combiner.totals_balance(total_assets, total_liab_equity)}")
+        return
+    
+    if args.mode == 'scenarios':
+        scenario_manager = ScenarioManager(scenarios_data)
+        scenario_table = pd.json_normalize(list(scenarios_data.values()))
+        scenario_table.index = list(scenario_manager.scenarios.keys())
+        print("\nScenarios:")
+        print(scenario_table.to_string())
+        return
+    
+    # Ensure output directory exists
+    Path(args.output_dir).mkdir(parents=True, exist_ok=True)
+    
     # Example asset step-ups and depreciation periods
     asset_step_ups = {
         'Property Plant & Equipment': 20000,
@@ -111,21 +165,17 @@ def main():
         target_bs=target_bs,
         scenarios_data=scenarios_data,
         acquisition_config=acq_config,
-        output_dir=f"{args.output_dir}/consolidated_balance_sheets"
+        output_dir=f"{args.output_dir}/consolidated_balance_sheets",
+        excel_engine=args.excel_engine
     )
     
-    # Example intercompany balances
-    intercompany_balances = {
-        'Accounts Receivable': 5000,
-        'Accounts Payable': 5000
-    }
-    
     print("\nProcessing scenarios...")
     # Run all scenarios
     results = workflow.run_all_scenarios(
         intercompany_balances=intercompany_balances,
         interest_rate=args.interest_rate,
-        save_output=True
+        save_output=True,
+        max_workers=args.workers or None
     )
     
     print("\nGenerating visualizations...")
@@ -133,20 +183,11 @@ def main():
     viz_manager = create_visualization_manager(f"{args.output_dir}/charts")
     
     # Prepare data for visualization
-    balance_sheets = {
-        scenario_name: scenario_results['balance_sheet']
-        for scenario_name, scenario_results in results.items()
-    }
-    
-    metrics = {
-        scenario_name: scenario_results['metrics']
-        for scenario_name, scenario_results in results.items()
-    }
-    
-    financing_impacts = {
-        scenario_name: scenario_results['financing_impacts']
-        for scenario_name, scenario_results in results.items()
-    }
+    balance_sheets, metrics, financing_impacts = {}, {}, {}
+    for scenario_name, scenario_results in results.items():
+        balance_sheets[scenario_name] = scenario_results['balance_sheet']
+        metrics[scenario_name] = scenario_results['metrics']
+        financing_impacts[scenario_name] = scenario_results['financing_impacts']
     
     # Create visualizations
     viz_manager.create_balance_sheet_chart(balance_sheets, args.chart_type)
@@ -155,14 +196,14 @@ def main():
     
     print("\nConsolidation Complete!")
     print("\nScenario Summaries:")
-    for scenario_name, scenario_results in results.items():
-        print(f"\n{scenario_name}:")
-        print("Key Metrics:")
-        for metric, value in scenario_results['metrics'].items():
-            print(f"  {metric}: {value:.2f}")
-        print("Financing Impacts:")
-        for impact, value in scenario_results['financing_impacts'].items():
-            print(f"  {impact}: {value:,.2f}")
+    print("\nKey Metrics:")
+    print(pd.DataFrame.from_dict(metrics, orient='index').to_string(
+        float_format='{:.2f}'.format
+    ))
+    print("\nFinancing Impacts:")
+    print(pd.DataFrame.from_dict(financing_impacts, orient='index').to_string(
+        float_format='{:,.2f}'.format
+    ))
     
     print(f"\nOutputs have been saved to the {args.output_dir} directory:")
     print(f"- Consolidated balance sheets: {args.output_dir}/consolidated_balance_sheets/")
@@ -1,11 +1,14 @@
 # adjustments.py
 
-from dataclasses import dataclass
-from typing import Dict, Optional
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Dict, Optional, Union
 import pandas as pd
 import numpy as np
 
-@dataclass
+# eq=False keeps identity equality and hashing, which dict-valued fields
+# would otherwise break on a frozen dataclass
+@dataclass(frozen=True, eq=False)
 class AcquisitionConfig:
     """Configuration for acquisition adjustments"""
     purchase_price: float
@@ -13,6 +16,17 @@ class AcquisitionConfig:
     tax_rate: float
     asset_step_ups: Dict[str, float]
     depreciation_periods: Dict[str, int]
+    total_step_ups: float = field(init=False)
+    
+    def __post_init__(self) -> None:
+        # Snapshot the caller's dicts so later edits to them cannot leak into
+        # a config whose derived values are cached
+        object.__setattr__(self, 'asset_step_ups', dict(self.asset_step_ups))
+        object.__setattr__(self, 'depreciation_periods', dict(self.depreciation_periods))
+        
+        # Precomputed once from the snapshot above, which is what keeps the
+        # sum in step with asset_step_ups (frozen alone would not)
+        object.__setattr__(self, 'total_step_ups', sum(self.asset_step_ups.values()))
 
 class AcquisitionAdjustments:
     def __init__(self, config: AcquisitionConfig):
@@ -24,26 +38,16 @@ class AcquisitionAdjustments:
         """
         self.config = config
         
-    def calculate_goodwill(self) -> float:
-        """
-        Calculate goodwill as the difference between purchase price and
-        adjusted book value (including step-ups).
-        
-        Returns:
-            float: Calculated goodwill amount
-        """
-        total_step_ups = sum(self.config.asset_step_ups.values())
-        adjusted_book_value = self.config.target_book_value + total_step_ups
+    @cached_property
+    def _goodwill(self) -> float:
+        """Goodwill for the (immutable) config, computed on first access."""
+        adjusted_book_value = self.config.target_book_value + self.config.total_step_ups
         goodwill = self.config.purchase_price - adjusted_book_value
         return max(goodwill, 0)  # Goodwill cannot be negative
-        
-    def calculate_step_up_impacts(self) -> Dict[str, float]:
-        """
-        Calculate tax and depreciation impacts of asset step-ups.
-        
-        Returns:
-            Dict[str, float]: Dictionary containing annual depreciation and tax impacts
-        """
+    
+    @cached_property
+    def _step_up_impacts(self) -> Dict[str, float]:
+        """Step-up impacts for the (immutable) config, computed on first access."""
         annual_depreciation = {}
         for asset, step_up in self.config.asset_step_ups.items():
             if asset in self.config.depreciation_periods:
@@ -60,6 +64,28 @@ class AcquisitionAdjustments:
             'total_annual_depreciation': total_annual_depreciation,
             'tax_shield': tax_shield
         }
+        
+    def calculate_goodwill(self) -> float:
+        """
+        Calculate goodwill as the difference between purchase price and
+        adjusted book value (including step-ups).
+        
+        Returns:
+            float: Calculated goodwill amount
+        """
+        return self._goodwill
+        
+    def calculate_step_up_impacts(self) -> Dict[str, float]:
+        """
+        Calculate tax and depreciation impacts of asset step-ups.
+        
+        Returns:
+            Dict[str, float]: Dictionary containing annual depreciation and tax impacts
+        """
+        # Copy so callers cannot mutate the memoized impacts
+        impacts = dict(self._step_up_impacts)
+        impacts['annual_depreciation'] = dict(impacts['annual_depreciation'])
+        return impacts
     
     def apply_adjustments(self, balance_sheet: pd.DataFrame) -> pd.DataFrame:
         """
@@ -71,37 +97,32 @@ class AcquisitionAdjustments:
         Returns:
             pd.DataFrame: Adjusted balance sheet
         """
-        adjusted_bs = balance_sheet.copy()
+        # Work on an Account-indexed Series so every adjustment is a keyed write;
+        # copy the amounts, since to_numpy can return a view of the caller's frame
+        adjusted = pd.Series(
+            balance_sheet['Amount'].to_numpy(dtype=float, copy=True),
+            index=pd.Index(balance_sheet['Account'].astype(object), name='Account'),
+            name='Amount'
+        )
         
         # Calculate and add goodwill
-        goodwill = self.calculate_goodwill()
-        goodwill_idx = adjusted_bs['Account'] == 'Goodwill'
-        adjusted_bs.loc[goodwill_idx, 'Amount'] += goodwill
+        if 'Goodwill' in adjusted.index:
+            adjusted['Goodwill'] += self._goodwill
         
-        # Apply asset step-ups
-        for asset, step_up in self.config.asset_step_ups.items():
-            asset_idx = adjusted_bs['Account'] == asset
-            if any(asset_idx):
-                adjusted_bs.loc[asset_idx, 'Amount'] += step_up
+        # Apply asset step-ups in one aligned add (step-ups to accounts not on
+        # the balance sheet are ignored)
+        step_ups = pd.Series(self.config.asset_step_ups, dtype=float, name='Amount')
+        adjusted = adjusted.add(step_ups.reindex(adjusted.index), fill_value=0)
         
         # Calculate deferred tax liability from step-ups
-        total_step_ups = sum(self.config.asset_step_ups.values())
-        deferred_tax = total_step_ups * self.config.tax_rate
-        
-        # Add deferred tax liability (create new row if doesn't exist)
-        if 'Deferred Tax Liability' not in adjusted_bs['Account'].values:
-            adjusted_bs = pd.concat([
-                adjusted_bs,
-                pd.DataFrame({
-                    'Account': ['Deferred Tax Liability'],
-                    'Amount': [deferred_tax]
-                })
-            ], ignore_index=True)
-        else:
-            dtl_idx = adjusted_bs['Account'] == 'Deferred Tax Liability'
-            adjusted_bs.loc[dtl_idx, 'Amount'] += deferred_tax
+        deferred_tax = self.config.total_step_ups * self.config.tax_rate
+        
+        # Add deferred tax liability (creates the row if it doesn't exist)
+        adjusted['Deferred Tax Liability'] = (
+            adjusted.get('Deferred Tax Liability', 0) + deferred_tax
+        )
             
-        return adjusted_bs
+        return adjusted.reset_index()
     
     def calculate_financing_impacts(
         self,
@@ -131,6 +152,34 @@ class AcquisitionAdjustments:
             'net_interest_cost': annual_interest - tax_shield
         }
 
+    def calculate_financing_impacts_batch(
+        self,
+        debt_ratios: Union[float, np.ndarray],
+        interest_rates: Union[float, np.ndarray]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate financing impacts for many debt ratio / interest rate pairs at once.
+        
+        Args:
+            debt_ratios (float or np.ndarray): Portions of purchase price funded by debt
+            interest_rates (float or np.ndarray): Annual interest rates on debt
+                (broadcast against debt_ratios)
+            
+        Returns:
+            Dict[str, np.ndarray]: Same keys as calculate_financing_impacts,
+                each holding one value per input pair
+        """
+        debt_financing = self.config.purchase_price * np.asarray(debt_ratios, dtype=float)
+        annual_interest = debt_financing * np.asarray(interest_rates, dtype=float)
+        tax_shield = annual_interest * self.config.tax_rate
+        
+        return {
+            'debt_financing': debt_financing,
+            'annual_interest': annual_interest,
+            'interest_tax_shield': tax_shield,
+            'net_interest_cost': annual_interest - tax_shield
+        }
+
 def create_acquisition_config(
     purchase_price: float,
     target_book_value: float,
@@ -4,6 +4,41 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Tuple
 
+# Balance sheet classification: 'A' for assets, 'LE' for liabilities & equity
+ACCOUNT_CATEGORY = {
+    'Cash and Cash Equivalents': 'A',
+    'Accounts Receivable': 'A',
+    'Inventory': 'A',
+    'Property Plant & Equipment': 'A',
+    'Goodwill': 'A',
+    'Accounts Payable': 'LE',
+    'Short-Term Debt': 'LE',
+    'Long-Term Debt': 'LE',
+    'Shareholders\' Equity': 'LE'
+}
+
+# Display order of accounts on a formatted balance sheet
+ACCOUNT_ORDER = tuple(ACCOUNT_CATEGORY)
+_ORDER_IDX = {account: i for i, account in enumerate(ACCOUNT_ORDER)}
+
+def _category_totals(df: pd.DataFrame) -> Tuple[float, float]:
+    """
+    Total assets and liabilities & equity in a single groupby pass.
+    
+    Args:
+        df (pd.DataFrame): Balance sheet with Account and Amount columns
+        
+    Returns:
+        Tuple[float, float]: Total assets and total liabilities & equity
+    """
+    totals = (
+        df.assign(cat=df['Account'].map(ACCOUNT_CATEGORY))
+        .groupby('cat')['Amount']
+        .sum()
+        .reindex(['A', 'LE'], fill_value=0)
+    )
+    return totals['A'], totals['LE']
+
 class BalanceSheetCombiner:
     def __init__(self, acquirer_bs: pd.DataFrame, target_bs: pd.DataFrame):
         """
@@ -16,6 +51,24 @@ class BalanceSheetCombiner:
         self.acquirer_bs = acquirer_bs
         self.target_bs = target_bs
         self.validate_balance_sheets()
+        
+        # Align both sheets once on a shared account axis (standard accounts
+        # first, then any extras) so combining is plain array arithmetic
+        self._accounts = list(dict.fromkeys([
+            *ACCOUNT_ORDER,
+            *acquirer_bs['Account'],
+            *target_bs['Account']
+        ]))
+        self._acq = self._aligned_amounts(acquirer_bs)
+        self._tgt = self._aligned_amounts(target_bs)
+
+    def _aligned_amounts(self, df: pd.DataFrame) -> np.ndarray:
+        """Amounts of a balance sheet as a float array ordered like self._accounts."""
+        return (
+            df.set_index('Account')['Amount']
+            .reindex(self._accounts, fill_value=0)
+            .to_numpy(dtype=float)
+        )
 
     def validate_balance_sheets(self) -> None:
         """
@@ -25,31 +78,13 @@ class BalanceSheetCombiner:
         Raises:
             ValueError: If balance sheets don't balance
         """
-        def calculate_totals(df: pd.DataFrame) -> Tuple[float, float]:
-            assets = df[df['Account'].isin([
-                'Cash and Cash Equivalents',
-                'Accounts Receivable',
-                'Inventory',
-                'Property Plant & Equipment',
-                'Goodwill'
-            ])]['Amount'].sum()
-            
-            liab_equity = df[df['Account'].isin([
-                'Accounts Payable',
-                'Short-Term Debt',
-                'Long-Term Debt',
-                'Shareholders\' Equity'
-            ])]['Amount'].sum()
-            
-            return assets, liab_equity
-
         # Check Acquirer's balance sheet
-        acq_assets, acq_liab_equity = calculate_totals(self.acquirer_bs)
+        acq_assets, acq_liab_equity = _category_totals(self.acquirer_bs)
         if not np.isclose(acq_assets, acq_liab_equity, rtol=1e-5):
             raise ValueError("Acquirer's balance sheet is not balanced")
 
         # Check Target's balance sheet
-        target_assets, target_liab_equity = calculate_totals(self.target_bs)
+        target_assets, target_liab_equity = _category_totals(self.target_bs)
         if not np.isclose(target_assets, target_liab_equity, rtol=1e-5):
             raise ValueError("Target's balance sheet is not balanced")
 
@@ -64,35 +99,31 @@ class BalanceSheetCombiner:
         Returns:
             pd.DataFrame: Combined balance sheet
         """
-        # Create a copy of balance sheets
-        combined_bs = pd.DataFrame(columns=['Account', 'Amount'])
-        
-        # Combine all accounts
-        for account in self.acquirer_bs['Account'].unique():
-            acquirer_amount = self.acquirer_bs[
-                self.acquirer_bs['Account'] == account
-            ]['Amount'].iloc[0]
-            
-            target_amount = self.target_bs[
-                self.target_bs['Account'] == account
-            ]['Amount'].iloc[0]
-            
-            # Eliminate intercompany balances if provided
-            if intercompany_balances and account in intercompany_balances:
-                combined_amount = acquirer_amount + target_amount - intercompany_balances[account]
-            else:
-                combined_amount = acquirer_amount + target_amount
-            
-            combined_bs = pd.concat([
-                combined_bs,
-                pd.DataFrame({
-                    'Account': [account],
-                    'Amount': [combined_amount]
-                })
-            ], ignore_index=True)
+        # Eliminate intercompany balances with one aligned subtraction
+        eliminations = (
+            pd.Series(intercompany_balances or {}, dtype=float)
+            .reindex(self._accounts, fill_value=0)
+            .to_numpy()
+        )
+        combined_bs = pd.DataFrame({
+            'Account': self._accounts,
+            'Amount': self._acq + self._tgt - eliminations
+        })
         
         return combined_bs
 
+    def combined_totals(self, combined_bs: pd.DataFrame) -> Tuple[float, float]:
+        """
+        Total both sides of the combined balance sheet.
+        
+        Args:
+            combined_bs (pd.DataFrame): Combined balance sheet to total
+            
+        Returns:
+            Tuple[float, float]: Total assets and total liabilities & equity
+        """
+        return _category_totals(combined_bs)
+
     def verify_combined_balance_sheet(self, combined_bs: pd.DataFrame) -> bool:
         """
         Verify that the combined balance sheet maintains the accounting equation:
@@ -104,28 +135,21 @@ class BalanceSheetCombiner:
         Returns:
             bool: True if balanced, False otherwise
         """
-        # Calculate total assets
-        total_assets = combined_bs[
-            combined_bs['Account'].isin([
-                'Cash and Cash Equivalents',
-                'Accounts Receivable',
-                'Inventory',
-                'Property Plant & Equipment',
-                'Goodwill'
-            ])
-        ]['Amount'].sum()
-        
-        # Calculate total liabilities and equity
-        total_liab_equity = combined_bs[
-            combined_bs['Account'].isin([
-                'Accounts Payable',
-                'Short-Term Debt',
-                'Long-Term Debt',
-                'Shareholders\' Equity'
-            ])
-        ]['Amount'].sum()
+        return self.totals_balance(*self.combined_totals(combined_bs))
+
+    def totals_balance(self, total_assets: float, total_liab_equity: float) -> bool:
+        """
+        Verify the accounting equation from totals already computed with
+        combined_totals, without summing the balance sheet again.
         
-        return np.isclose(total_assets, total_liab_equity, rtol=1e-5)
+        Args:
+            total_assets (float): Total assets
+            total_liab_equity (float): Total liabilities & equity
+            
+        Returns:
+            bool: True if balanced, False otherwise
+        """
+        return bool(np.isclose(total_assets, total_liab_equity, rtol=1e-5))
 
 def format_balance_sheet(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -137,21 +161,8 @@ def format_balance_sheet(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Formatted balance sheet
     """
-    # Define the order of accounts
-    account_order = [
-        'Cash and Cash Equivalents',
-        'Accounts Receivable',
-        'Inventory',
-        'Property Plant & Equipment',
-        'Goodwill',
-        'Accounts Payable',
-        'Short-Term Debt',
-        'Long-Term Debt',
-        'Shareholders\' Equity'
-    ]
-    
-    # Sort the balance sheet according to the defined order
-    df['Account'] = pd.Categorical(df['Account'], categories=account_order, ordered=True)
-    formatted_df = df.sort_values('Account').reset_index(drop=True)
+    # Stable argsort over integer positions; unknown accounts sort last
+    idx = df['Account'].map(_ORDER_IDX).to_numpy(dtype=float, na_value=np.nan)
+    formatted_df = df.iloc[np.argsort(idx, kind='stable')].reset_index(drop=True)
     
     return formatted_df
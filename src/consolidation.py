@@ -1,6 +1,9 @@
 # consolidation.py
 
-from typing import Dict, Optional
+from typing import Dict, FrozenSet, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+import multiprocessing
 import pandas as pd
 from pathlib import Path
 import os
@@ -15,7 +18,8 @@ class ConsolidationWorkflow:
         bs_combiner: BalanceSheetCombiner,
         adjustments: AcquisitionAdjustments,
         scenario_manager: ScenarioManager,
-        output_dir: str = 'output/consolidated_balance_sheets'
+        output_dir: str = 'output/consolidated_balance_sheets',
+        excel_engine: str = 'xlsxwriter'
     ):
         """
         Initialize the consolidation workflow.
@@ -25,11 +29,18 @@ class ConsolidationWorkflow:
             adjustments: Acquisition adjustments instance
             scenario_manager: Scenario manager instance
             output_dir: Directory for output files
+            excel_engine: Excel writer ('xlsxwriter' or 'pyexcelerate')
         """
         self.bs_combiner = bs_combiner
         self.adjustments = adjustments
         self.scenario_manager = scenario_manager
         self.output_dir = output_dir
+        self.excel_engine = excel_engine
+        # Per-instance memo of scenario results; call cache_clear() on it
+        # after mutating any of the components above
+        self._compute_all_scenarios_cached = lru_cache(maxsize=64)(
+            self._compute_all_scenarios
+        )
         self._ensure_output_directory()
     
     def _ensure_output_directory(self) -> None:
@@ -45,6 +56,10 @@ class ConsolidationWorkflow:
         """
         Process a single scenario and generate outputs.
         
+        All scenarios are computed together in one vectorized pass and
+        memoized per workflow on the intercompany balances and interest rate,
+        so processing the remaining scenarios afterwards is a cache lookup.
+        
         Args:
             scenario_name: Name of the scenario to process
             intercompany_balances: Dictionary of intercompany balances to eliminate
@@ -55,32 +70,51 @@ class ConsolidationWorkflow:
         """
         # Set current scenario
         self.scenario_manager.set_scenario(scenario_name)
-        scenario = self.scenario_manager.get_current_scenario()
         
-        # Combine balance sheets
-        combined_bs = self.bs_combiner.combine_balance_sheets(intercompany_balances)
-        formatted_bs = format_balance_sheet(combined_bs)
+        intercompany_key = frozenset((intercompany_balances or {}).items())
+        cached = self._compute_all_scenarios_cached(intercompany_key, interest_rate)[scenario_name]
         
-        # Apply acquisition adjustments
+        # Copy so callers cannot mutate the memoized results
+        return {
+            'balance_sheet': cached['balance_sheet'].copy(),
+            'metrics': dict(cached['metrics']),
+            'financing_impacts': dict(cached['financing_impacts'])
+        }
+    
+    def _compute_all_scenarios(
+        self,
+        intercompany_key: FrozenSet[Tuple[str, float]],
+        interest_rate: float
+    ) -> Dict[str, Dict]:
+        """Run the consolidation pipeline for every scenario at once."""
+        # Combining and acquisition adjustments don't depend on the scenario
+        combined_bs = self.bs_combiner.combine_balance_sheets(dict(intercompany_key))
+        formatted_bs = format_balance_sheet(combined_bs)
         adjusted_bs = self.adjustments.apply_adjustments(formatted_bs)
         
-        # Calculate financing impacts
-        financing_impacts = self.adjustments.calculate_financing_impacts(
-            adjusted_bs,
-            debt_ratio=scenario.financing_mix['debt'],
-            interest_rate=interest_rate
+        # Scenario adjustments, metrics and financing impacts as array math
+        # over all scenarios
+        scenario_amounts = self.scenario_manager.apply_all_scenario_adjustments(adjusted_bs)
+        metrics = self.scenario_manager.calculate_all_metrics(
+            adjusted_bs['Account'],
+            scenario_amounts
+        )
+        financing_impacts = self.adjustments.calculate_financing_impacts_batch(
+            self.scenario_manager.get_debt_ratios(),
+            interest_rate
         )
-        
-        # Apply scenario-specific adjustments
-        final_bs = self.scenario_manager.apply_scenario_adjustments(adjusted_bs)
-        
-        # Calculate metrics
-        metrics = self.scenario_manager.calculate_metrics(final_bs)
         
         return {
-            'balance_sheet': final_bs,
-            'metrics': metrics,
-            'financing_impacts': financing_impacts
+            scenario_name: {
+                'balance_sheet': adjusted_bs.assign(Amount=scenario_amounts[i]),
+                'metrics': {
+                    name: float(values[i]) for name, values in metrics.items()
+                },
+                'financing_impacts': {
+                    name: float(values[i]) for name, values in financing_impacts.items()
+                }
+            }
+            for i, scenario_name in enumerate(self.scenario_manager.scenarios)
         }
     
     def save_outputs(self, scenario_name: str, results: Dict) -> None:
@@ -92,8 +126,22 @@ class ConsolidationWorkflow:
             results: Dictionary containing results to save
         """
         output_file = os.path.join(self.output_dir, f"{scenario_name}.xlsx")
+        self._write_workbook(output_file, results, self.excel_engine)
+    
+    @staticmethod
+    def _write_workbook(output_file: str, results: Dict, excel_engine: str) -> None:
+        """Write one scenario's results to output_file with the given engine."""
+        if excel_engine == 'pyexcelerate':
+            ConsolidationWorkflow._save_outputs_pyexcelerate(output_file, results)
+            return
         
-        with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
+        # Metrics divide by equity and total assets, so inf/NaN are possible;
+        # write them as Excel error cells rather than failing the save
+        with pd.ExcelWriter(
+            output_file,
+            engine='xlsxwriter',
+            engine_kwargs={'options': {'nan_inf_to_errors': True}}
+        ) as writer:
             # Save balance sheet
             results['balance_sheet'].to_excel(
                 writer,
@@ -101,25 +149,57 @@ class ConsolidationWorkflow:
                 index=False
             )
             
-            # Save metrics
-            pd.DataFrame([results['metrics']]).to_excel(
-                writer,
-                sheet_name='Metrics',
-                index=False
-            )
-            
-            # Save financing impacts
-            pd.DataFrame([results['financing_impacts']]).to_excel(
+            # Save metrics and financing impacts as header/value rows written
+            # straight to the workbook, without a throwaway DataFrame
+            ConsolidationWorkflow._write_dict_sheet(writer, 'Metrics', results['metrics'])
+            ConsolidationWorkflow._write_dict_sheet(
                 writer,
-                sheet_name='Financing Impacts',
-                index=False
+                'Financing Impacts',
+                results['financing_impacts']
             )
     
+    @staticmethod
+    def _write_dict_sheet(
+        writer: pd.ExcelWriter,
+        sheet_name: str,
+        data: Dict[str, float]
+    ) -> None:
+        """Write a flat dict as a header row of keys over a row of values."""
+        worksheet = writer.book.add_worksheet(sheet_name)
+        worksheet.write_row(0, 0, list(data.keys()))
+        worksheet.write_row(1, 0, list(data.values()))
+    
+    @staticmethod
+    def _save_outputs_pyexcelerate(output_file: str, results: Dict) -> None:
+        """Write scenario results as bulk 2D sheets with pyexcelerate."""
+        from pyexcelerate import Workbook
+        
+        balance_sheet = results['balance_sheet']
+        
+        wb = Workbook()
+        wb.new_sheet(
+            'Balance Sheet',
+            data=[balance_sheet.columns.tolist()] + balance_sheet.values.tolist()
+        )
+        wb.new_sheet(
+            'Metrics',
+            data=[list(results['metrics'].keys()), list(results['metrics'].values())]
+        )
+        wb.new_sheet(
+            'Financing Impacts',
+            data=[
+                list(results['financing_impacts'].keys()),
+                list(results['financing_impacts'].values())
+            ]
+        )
+        wb.save(output_file)
+    
     def run_all_scenarios(
         self,
         intercompany_balances: Optional[Dict] = None,
         interest_rate: float = 0.05,
-        save_output: bool = True
+        save_output: bool = True,
+        max_workers: Optional[int] = 1
     ) -> Dict[str, Dict]:
         """
         Process all scenarios and optionally save results.
@@ -128,36 +208,95 @@ class ConsolidationWorkflow:
             intercompany_balances: Dictionary of intercompany balances to eliminate
             interest_rate: Interest rate for debt financing
             save_output: Whether to save results to Excel files
+            max_workers: Number of worker processes writing the workbooks, or
+                None for one per CPU; workbooks are written on background
+                threads in this process when 1
             
         Returns:
             Dictionary containing results for all scenarios
         """
         results = {}
+        scenario_names = list(self.scenario_manager.scenarios.keys())
         
-        for scenario_name in self.scenario_manager.scenarios.keys():
-            print(f"Processing scenario: {scenario_name}")
+        if max_workers is None or max_workers > 1:
+            # All scenarios come out of one memoized vectorized pass here, so
+            # only the workbook writes are worth fanning out to processes
+            for scenario_name in scenario_names:
+                print(f"Processing scenario: {scenario_name}")
+                results[scenario_name] = self.process_scenario(
+                    scenario_name,
+                    intercompany_balances,
+                    interest_rate
+                )
             
-            # Process scenario
-            scenario_results = self.process_scenario(
-                scenario_name,
-                intercompany_balances,
-                interest_rate
-            )
-            
-            # Save results if requested
             if save_output:
-                self.save_outputs(scenario_name, scenario_results)
+                tasks = [
+                    (
+                        os.path.join(self.output_dir, f"{scenario_name}.xlsx"),
+                        scenario_results,
+                        self.excel_engine
+                    )
+                    for scenario_name, scenario_results in results.items()
+                ]
+                # Spawn rather than fork: the pyarrow reads leave native
+                # threads running here, and forking a threaded process can
+                # deadlock the children
+                with ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                ) as executor:
+                    # Drain the iterator so any write error is re-raised
+                    list(executor.map(_save_in_worker, tasks))
+            
+            return results
+        
+        # Background writers so saving one workbook overlaps the next
+        # scenario; the pool is shut down with the call
+        with ThreadPoolExecutor(max_workers=2) as io_pool:
+            save_futures = []
+            for scenario_name in scenario_names:
+                print(f"Processing scenario: {scenario_name}")
+                
+                # Process scenario
+                scenario_results = self.process_scenario(
+                    scenario_name,
+                    intercompany_balances,
+                    interest_rate
+                )
+                
+                # Save results in the background if requested
+                if save_output:
+                    save_futures.append(io_pool.submit(
+                        self.save_outputs,
+                        scenario_name,
+                        scenario_results
+                    ))
+                
+                results[scenario_name] = scenario_results
             
-            results[scenario_name] = scenario_results
+            # Wait for pending saves, re-raising any write error
+            for future in save_futures:
+                future.result()
         
         return results
 
+def _save_in_worker(task: Tuple[str, Dict, str]) -> None:
+    """
+    Write one scenario workbook in a worker process.
+    
+    Args:
+        task: (output_file, scenario_results, excel_engine)
+    """
+    output_file, scenario_results, excel_engine = task
+    ConsolidationWorkflow._write_workbook(output_file, scenario_results, excel_engine)
+
 def create_consolidation_workflow(
     acquirer_bs: pd.DataFrame,
     target_bs: pd.DataFrame,
     scenarios_data: Dict,
     acquisition_config: Dict,
-    output_dir: str = 'output/consolidated_balance_sheets'
+    output_dir: str = 'output/consolidated_balance_sheets',
+    excel_engine: str = 'xlsxwriter'
 ) -> ConsolidationWorkflow:
     """
     Helper function to create ConsolidationWorkflow instance.
@@ -168,6 +307,7 @@ def create_consolidation_workflow(
         scenarios_data: Dictionary of scenario configurations
         acquisition_config: Configuration for acquisition adjustments
         output_dir: Directory for output files
+        excel_engine: Excel writer ('xlsxwriter' or 'pyexcelerate')
         
     Returns:
         Configured ConsolidationWorkflow instance
@@ -180,5 +320,6 @@ def create_consolidation_workflow(
         bs_combiner,
         adjustments,
         scenario_manager,
-        output_dir
+        output_dir,
+        excel_engine
     )
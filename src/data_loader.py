@@ -1,9 +1,55 @@
 # data_loader.py
 
 import pandas as pd
-import json
 import os
-from typing import Dict, Any
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Any
+
+# One JSON parser bound under a single name: orjson when installed, else the
+# stdlib parser, whose loads() accepts bytes too
+_json_loads: Callable[[bytes], Any]
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+# Column dtypes for balance sheet CSVs; amounts stay at full double precision
+# since float32 cannot represent money values exactly beyond ~7 digits
+_CSV_DTYPES = {
+    'Account': 'string[pyarrow]',
+    'Amount': 'double[pyarrow]',
+    'Acquirer': 'double[pyarrow]',
+    'Target': 'double[pyarrow]'
+}
+
+# Structure every balance sheet must have; two-column sheets hold a single
+# company, three-column sheets hold acquirer and target side by side
+_REQUIRED_COLS_2 = frozenset({'Account', 'Amount'})
+_REQUIRED_COLS_3 = frozenset({'Account', 'Acquirer', 'Target'})
+_REQUIRED_ACCOUNTS = frozenset({
+    'Cash and Cash Equivalents',
+    'Accounts Receivable',
+    'Inventory',
+    'Property Plant & Equipment',
+    'Goodwill',
+    'Accounts Payable',
+    'Short-Term Debt',
+    'Long-Term Debt',
+    'Shareholders\' Equity'
+})
+
+def _normalize_balance_sheet_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Give a validated balance sheet the same dtypes whichever file it came from."""
+    # Low-cardinality account names are dictionary-encoded
+    dtypes = {'Account': 'category'}
+    dtypes.update({
+        col: dtype for col, dtype in _CSV_DTYPES.items()
+        if col != 'Account' and col in df.columns
+    })
+    return df.astype(dtypes)
 
 def validate_balance_sheet_structure(df: pd.DataFrame) -> None:
     """
@@ -15,25 +61,13 @@ def validate_balance_sheet_structure(df: pd.DataFrame) -> None:
     Raises:
         ValueError: If required columns or accounts are missing
     """
-    required_columns = {'Account', 'Amount'} if len(df.columns) == 2 else {'Account', 'Acquirer', 'Target'}
-    if not all(col in df.columns for col in required_columns):
-        raise ValueError(f"Balance sheet must contain columns: {required_columns}")
-    
-    required_accounts = {
-        'Cash and Cash Equivalents',
-        'Accounts Receivable',
-        'Inventory',
-        'Property Plant & Equipment',
-        'Goodwill',
-        'Accounts Payable',
-        'Short-Term Debt',
-        'Long-Term Debt',
-        'Shareholders\' Equity'
-    }
+    required_columns = _REQUIRED_COLS_2 if len(df.columns) == 2 else _REQUIRED_COLS_3
+    if not required_columns.issubset(df.columns):
+        raise ValueError(f"Balance sheet must contain columns: {set(required_columns)}")
     
-    missing_accounts = required_accounts - set(df['Account'])
+    missing_accounts = _REQUIRED_ACCOUNTS.difference(df['Account'].unique())
     if missing_accounts:
-        raise ValueError(f"Missing required accounts: {missing_accounts}")
+        raise ValueError(f"Missing required accounts: {set(missing_accounts)}")
 
 def validate_scenarios_structure(data: Dict[str, Any]) -> None:
     """
@@ -95,17 +129,37 @@ def load_balance_sheet_excel(file_path: str) -> pd.DataFrame:
         FileNotFoundError: If file doesn't exist
         ValueError: If data structure is invalid
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"File not found: {file_path}")
+    # Only the first sheet is needed; pandas' openpyxl reader already opens
+    # workbooks read-only with cached values (data_only)
+    try:
+        df = pd.read_excel(file_path, sheet_name=0, engine='openpyxl')
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"File not found: {file_path}") from e
     
-    df = pd.read_excel(file_path)
     validate_balance_sheet_structure(df)
     return df
 
+@lru_cache(maxsize=8)
+def _read_balance_sheet_csv(file_path: str, mtime: float) -> pd.DataFrame:
+    """Parse and validate a balance sheet CSV; cached per (path, mtime)."""
+    # Arrow's multi-threaded parser with a fixed schema; only columns present
+    # in the header are typed, since older pyarrow readers reject unknown ones
+    header = pd.read_csv(file_path, nrows=0).columns
+    df = pd.read_csv(
+        file_path,
+        engine='pyarrow',
+        dtype_backend='pyarrow',
+        dtype={col: _CSV_DTYPES[col] for col in header if col in _CSV_DTYPES}
+    )
+    validate_balance_sheet_structure(df)
+    return _normalize_balance_sheet_dtypes(df)
+
 def load_balance_sheet_csv(file_path: str) -> pd.DataFrame:
     """
     Load and validate balance sheet data from a CSV file.
     
+    Repeated loads of an unchanged file within a process reuse the parsed data.
+    
     Args:
         file_path: Path to CSV file
         
@@ -116,11 +170,63 @@ def load_balance_sheet_csv(file_path: str) -> pd.DataFrame:
         FileNotFoundError: If file doesn't exist
         ValueError: If data structure is invalid
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"File not found: {file_path}")
+    try:
+        mtime = os.path.getmtime(file_path)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"File not found: {file_path}") from e
     
-    df = pd.read_csv(file_path)
-    validate_balance_sheet_structure(df)
+    # Hand out a copy so callers cannot mutate the cached frame
+    return _read_balance_sheet_csv(file_path, mtime).copy()
+
+def load_balance_sheet_cached(file_path: str) -> pd.DataFrame:
+    """
+    Load balance sheet data from a CSV file, caching it in a parquet side-file.
+    
+    The parquet copy is written next to the CSV on first load and reused while
+    it is at least as new as the CSV; an unreadable copy is rebuilt.
+    
+    Args:
+        file_path: Path to CSV file
+        
+    Returns:
+        Validated balance sheet DataFrame
+        
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If data structure is invalid
+    """
+    csv_path = Path(file_path)
+    cache_path = csv_path.with_suffix('.parquet')
+    
+    try:
+        csv_mtime = csv_path.stat().st_mtime
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"File not found: {file_path}") from e
+    
+    try:
+        cache_is_fresh = cache_path.stat().st_mtime >= csv_mtime
+    except FileNotFoundError:
+        cache_is_fresh = False
+    
+    if cache_is_fresh:
+        try:
+            df = pd.read_parquet(cache_path, dtype_backend='pyarrow')
+            validate_balance_sheet_structure(df)
+            return _normalize_balance_sheet_dtypes(df)
+        except (OSError, ValueError):
+            pass  # unreadable or invalid sidecar; rebuild it from the CSV
+    
+    df = load_balance_sheet_csv(file_path)
+    
+    # Write to a per-process temp file and rename it into place, so a killed
+    # or concurrent writer can never leave a partial sidecar behind
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # The cache is best-effort; a read-only data dir just skips it
+        tmp_path.unlink(missing_ok=True)
     return df
 
 def parse_scenarios_json(file_path: str) -> Dict[str, Any]:
@@ -137,11 +243,10 @@ def parse_scenarios_json(file_path: str) -> Dict[str, Any]:
         FileNotFoundError: If file doesn't exist
         ValueError: If data structure is invalid
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"File not found: {file_path}")
-    
-    with open(file_path, 'r') as f:
-        data = json.load(f)
+    try:
+        data = _json_loads(Path(file_path).read_bytes())
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"File not found: {file_path}") from e
     
     validate_scenarios_structure(data)
     return data
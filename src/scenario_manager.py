@@ -1,10 +1,29 @@
 # scenario_manager.py
 
 import pandas as pd
+import numpy as np
 from typing import Dict, Optional, Any
 from dataclasses import dataclass
 
-@dataclass
+# Metric bucket of each account; accounts not listed don't enter the metrics
+_ACCOUNT_BUCKET = {
+    'Cash and Cash Equivalents': 'asset',
+    'Accounts Receivable': 'asset',
+    'Inventory': 'asset',
+    'Property Plant & Equipment': 'asset',
+    'Goodwill': 'asset',
+    'Short-Term Debt': 'debt',
+    'Long-Term Debt': 'debt',
+    'Shareholders\' Equity': 'equity'
+}
+
+# Accounts touched by scenario adjustments
+_CASH_ACCOUNT = 'Cash and Cash Equivalents'
+_LONG_TERM_DEBT_ACCOUNT = 'Long-Term Debt'
+_EQUITY_ACCOUNT = 'Shareholders\' Equity'
+
+# Frozen like AcquisitionConfig, with identity equality for the same reason
+@dataclass(frozen=True, eq=False)
 class ScenarioConfig:
     """Data class to hold scenario configuration"""
     purchase_price: float
@@ -12,6 +31,12 @@ class ScenarioConfig:
     synergies: Dict[str, float]
     transaction_costs: float
     tax_rate: float
+    
+    def __post_init__(self) -> None:
+        # ScenarioManager mirrors every field into arrays at load time, so
+        # snapshot the nested dicts rather than share the caller's
+        object.__setattr__(self, 'financing_mix', dict(self.financing_mix))
+        object.__setattr__(self, 'synergies', dict(self.synergies))
 
 class ScenarioManager:
     def __init__(self, scenarios_data: Dict[str, Dict[str, Any]]):
@@ -27,7 +52,8 @@ class ScenarioManager:
 
     def _load_scenarios(self, scenarios_data: Dict[str, Dict[str, Any]]) -> None:
         """
-        Load scenarios from input data into ScenarioConfig objects.
+        Load scenarios from input data into ScenarioConfig objects, plus one
+        array per numeric field indexed by scenario position.
         
         Args:
             scenarios_data (Dict): Dictionary containing scenario configurations
@@ -40,6 +66,15 @@ class ScenarioManager:
                 transaction_costs=config['transaction_costs'],
                 tax_rate=config['tax_rate']
             )
+        
+        configs = list(self.scenarios.values())
+        self._name_to_idx = {name: i for i, name in enumerate(self.scenarios)}
+        self._purchase_price = np.array([c.purchase_price for c in configs], dtype=np.float64)
+        self._debt_frac = np.array([c.financing_mix['debt'] for c in configs], dtype=np.float64)
+        self._equity_frac = np.array([c.financing_mix['equity'] for c in configs], dtype=np.float64)
+        self._txn_costs = np.array([c.transaction_costs for c in configs], dtype=np.float64)
+        self._cost_savings = np.array([c.synergies['cost_savings'] for c in configs], dtype=np.float64)
+        self._revenue_growth = np.array([c.synergies['revenue_growth'] for c in configs], dtype=np.float64)
 
     def set_scenario(self, scenario_name: str) -> None:
         """
@@ -82,29 +117,92 @@ class ScenarioManager:
         if self.current_scenario is None:
             raise ValueError("No scenario currently set")
 
-        scenario = self.get_current_scenario()
-        adjusted_bs = combined_bs.copy()
+        idx = self._name_to_idx[self.current_scenario]
+        # Index by account so each adjustment is an O(1) keyed update
+        adjusted_bs = combined_bs.set_index('Account', drop=False)
 
         # Apply financing mix adjustments
-        debt_financing = scenario.purchase_price * scenario.financing_mix['debt']
-        equity_financing = scenario.purchase_price * scenario.financing_mix['equity']
+        debt_financing = self._purchase_price[idx] * self._debt_frac[idx]
+        equity_financing = self._purchase_price[idx] * self._equity_frac[idx]
 
         # Update debt and equity accounts
-        debt_idx = adjusted_bs['Account'] == 'Long-Term Debt'
-        equity_idx = adjusted_bs['Account'] == 'Shareholders\' Equity'
-
-        adjusted_bs.loc[debt_idx, 'Amount'] += debt_financing
-        adjusted_bs.loc[equity_idx, 'Amount'] += equity_financing
+        adjusted_bs.at[_LONG_TERM_DEBT_ACCOUNT, 'Amount'] += debt_financing
+        adjusted_bs.at[_EQUITY_ACCOUNT, 'Amount'] += equity_financing
 
         # Apply transaction costs (typically reduces cash)
-        cash_idx = adjusted_bs['Account'] == 'Cash and Cash Equivalents'
-        adjusted_bs.loc[cash_idx, 'Amount'] -= scenario.transaction_costs
+        adjusted_bs.at[_CASH_ACCOUNT, 'Amount'] -= self._txn_costs[idx]
 
         # Apply synergies impact (simplified - adds to cash)
-        total_synergies = scenario.synergies['cost_savings'] + scenario.synergies['revenue_growth']
-        adjusted_bs.loc[cash_idx, 'Amount'] += total_synergies
+        total_synergies = self._cost_savings[idx] + self._revenue_growth[idx]
+        adjusted_bs.at[_CASH_ACCOUNT, 'Amount'] += total_synergies
+
+        return adjusted_bs.reset_index(drop=True)
+
+    def get_debt_ratios(self) -> np.ndarray:
+        """
+        Get the debt share of the financing mix for every scenario.
+        
+        Returns:
+            np.ndarray: Debt ratios in scenario load order
+        """
+        return self._debt_frac.copy()
 
-        return adjusted_bs
+    def apply_all_scenario_adjustments(self, combined_bs: pd.DataFrame) -> np.ndarray:
+        """
+        Apply every scenario's adjustments to the combined balance sheet at once.
+        
+        Args:
+            combined_bs (pd.DataFrame): Combined balance sheet before adjustments
+            
+        Returns:
+            np.ndarray: Adjusted amounts with one row per scenario (in load order)
+                and one column per row of combined_bs
+        """
+        accounts = pd.Index(combined_bs['Account'])
+        adjusted = np.tile(
+            combined_bs['Amount'].to_numpy(dtype=float),
+            (len(self.scenarios), 1)
+        )
+
+        # Financing mix, transaction costs and synergies as per-scenario vectors
+        adjusted[:, accounts.get_loc(_LONG_TERM_DEBT_ACCOUNT)] += (
+            self._purchase_price * self._debt_frac
+        )
+        adjusted[:, accounts.get_loc(_EQUITY_ACCOUNT)] += (
+            self._purchase_price * self._equity_frac
+        )
+        adjusted[:, accounts.get_loc(_CASH_ACCOUNT)] += (
+            self._cost_savings + self._revenue_growth - self._txn_costs
+        )
+
+        return adjusted
+
+    def calculate_all_metrics(
+        self,
+        accounts: pd.Series,
+        adjusted: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate key financial metrics for every scenario at once.
+        
+        Args:
+            accounts (pd.Series): Account of each column of adjusted
+            adjusted (np.ndarray): Output of apply_all_scenario_adjustments
+            
+        Returns:
+            Dict[str, np.ndarray]: Same metrics as calculate_metrics, one value
+                per scenario
+        """
+        buckets = accounts.map(_ACCOUNT_BUCKET).to_numpy()
+        total_assets = adjusted[:, buckets == 'asset'].sum(axis=1)
+        total_debt = adjusted[:, buckets == 'debt'].sum(axis=1)
+        equity = adjusted[:, buckets == 'equity'].sum(axis=1)
+
+        return {
+            'leverage_ratio': total_debt / equity,
+            'debt_to_assets': total_debt / total_assets,
+            'equity_to_assets': equity / total_assets
+        }
 
     def calculate_metrics(self, adjusted_bs: pd.DataFrame) -> Dict[str, float]:
         """
@@ -116,26 +214,16 @@ class ScenarioManager:
         Returns:
             Dict[str, float]: Dictionary of calculated metrics
         """
-        total_assets = adjusted_bs[
-            adjusted_bs['Account'].isin([
-                'Cash and Cash Equivalents',
-                'Accounts Receivable',
-                'Inventory',
-                'Property Plant & Equipment',
-                'Goodwill'
-            ])
-        ]['Amount'].sum()
-
-        total_debt = adjusted_bs[
-            adjusted_bs['Account'].isin([
-                'Short-Term Debt',
-                'Long-Term Debt'
-            ])
-        ]['Amount'].sum()
-
-        equity = adjusted_bs[
-            adjusted_bs['Account'] == 'Shareholders\' Equity'
-        ]['Amount'].sum()
+        # One hash pass over Account buckets every amount
+        buckets = adjusted_bs['Account'].map(_ACCOUNT_BUCKET)
+        totals = (
+            adjusted_bs.groupby(buckets)['Amount']
+            .sum()
+            .reindex(['asset', 'debt', 'equity'], fill_value=0)
+        )
+        total_assets = totals['asset']
+        total_debt = totals['debt']
+        equity = totals['equity']
 
         return {
             'leverage_ratio': total_debt / equity,
@@ -1,13 +1,18 @@
 # visualization.py
 
 import pandas as pd
-import matplotlib.pyplot as plt
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import os
 from typing import Dict, List
 from pathlib import Path
 
+# Matplotlib's Set3 palette, used as the Plotly colorway
+_COLORWAY = [
+    '#8dd3c7', '#ffffb3', '#bebada', '#fb8072', '#80b1d3', '#fdb462',
+    '#b3de69', '#fccde5', '#d9d9d9', '#bc80bd', '#ccebc5', '#ffed6f'
+]
+
 class VisualizationManager:
     def __init__(self, output_dir: str = 'output/charts'):
         """
@@ -19,6 +24,16 @@ class VisualizationManager:
         self.output_dir = output_dir
         Path(output_dir).mkdir(parents=True, exist_ok=True)
     
+    def _write_html(self, fig: go.Figure, filename: str) -> None:
+        """Write a figure to the output directory, loading plotly.js from the CDN."""
+        fig.write_html(
+            os.path.join(self.output_dir, filename),
+            config={'responsive': True},
+            include_plotlyjs='cdn',
+            full_html=True,
+            validate=False
+        )
+    
     def create_balance_sheet_chart(
         self,
         balance_sheets: Dict[str, pd.DataFrame],
@@ -59,35 +74,34 @@ class VisualizationManager:
             'Shareholders\' Equity'
         ]
         
-        colors = plt.cm.Set3(np.linspace(0, 1, max(len(asset_accounts), len(liab_equity_accounts))))
-        
-        for scenario_name, bs in balance_sheets.items():
+        for i, (scenario_name, bs) in enumerate(balance_sheets.items()):
+            amounts = bs.set_index('Account')['Amount']
+            # One colorway entry per scenario, shared by both subplots
+            color = _COLORWAY[i % len(_COLORWAY)]
+            
             # Assets
-            asset_values = [
-                bs[bs['Account'] == account]['Amount'].iloc[0]
-                for account in asset_accounts
-            ]
+            asset_values = amounts.reindex(asset_accounts).to_numpy()
             fig.add_trace(
                 go.Bar(
                     name=scenario_name,
                     x=asset_accounts,
                     y=asset_values,
-                    marker_color=colors
+                    marker_color=color,
+                    legendgroup=scenario_name
                 ),
                 row=1, col=1
             )
             
             # Liabilities & Equity
-            liab_equity_values = [
-                bs[bs['Account'] == account]['Amount'].iloc[0]
-                for account in liab_equity_accounts
-            ]
+            liab_equity_values = amounts.reindex(liab_equity_accounts).to_numpy()
             fig.add_trace(
                 go.Bar(
                     name=scenario_name,
                     x=liab_equity_accounts,
                     y=liab_equity_values,
-                    marker_color=colors
+                    marker_color=color,
+                    legendgroup=scenario_name,
+                    showlegend=False
                 ),
                 row=1, col=2
             )
@@ -95,10 +109,11 @@ class VisualizationManager:
         fig.update_layout(
             title='Balance Sheet Comparison Across Scenarios',
             barmode='group',
-            height=600
+            height=600,
+            colorway=_COLORWAY
         )
         
-        fig.write_html(os.path.join(self.output_dir, 'balance_sheet_comparison.html'))
+        self._write_html(fig, 'balance_sheet_comparison.html')
     
     def create_metrics_chart(
         self,
@@ -138,7 +153,7 @@ class VisualizationManager:
             showlegend=False
         )
         
-        fig.write_html(os.path.join(self.output_dir, 'metrics_comparison.html'))
+        self._write_html(fig, 'metrics_comparison.html')
     
     def create_financing_impact_chart(
         self,
@@ -181,7 +196,7 @@ class VisualizationManager:
             height=500
         )
         
-        fig.write_html(os.path.join(self.output_dir, 'financing_impacts.html'))
+        self._write_html(fig, 'financing_impacts.html')
 
 def create_visualization_manager(output_dir: str = 'output/charts') -> VisualizationManager:
     """
@@ -0,0 +1,23 @@
+# test_adjustments.py
+
+import pandas as pd
+
+from src.adjustments import AcquisitionAdjustments, create_acquisition_config
+
+def test_apply_adjustments_leaves_input_unchanged() -> None:
+    balance_sheet = pd.DataFrame({
+        'Account': ['Cash and Cash Equivalents', 'Property Plant & Equipment', 'Goodwill'],
+        'Amount': [70000.0, 150000.0, 0.0]
+    })
+    original = balance_sheet.copy()
+    adjustments = AcquisitionAdjustments(create_acquisition_config(
+        purchase_price=150000,
+        target_book_value=95000,
+        tax_rate=0.25,
+        asset_step_ups={'Property Plant & Equipment': 10000}
+    ))
+    
+    adjustments.apply_adjustments(balance_sheet)
+    adjustments.apply_adjustments(balance_sheet)
+    
+    pd.testing.assert_frame_equal(balance_sheet, original)
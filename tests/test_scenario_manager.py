@@ -0,0 +1,80 @@
+# test_scenario_manager.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.scenario_manager import ScenarioManager
+
+SCENARIOS = {
+    'base_case': {
+        'purchase_price': 150000,
+        'financing_mix': {'debt': 0.6, 'equity': 0.4},
+        'synergies': {'cost_savings': 10000, 'revenue_growth': 5000},
+        'transaction_costs': 5000,
+        'tax_rate': 0.25
+    },
+    'optimistic_case': {
+        'purchase_price': 140000,
+        'financing_mix': {'debt': 0.5, 'equity': 0.5},
+        'synergies': {'cost_savings': 15000, 'revenue_growth': 10000},
+        'transaction_costs': 4000,
+        'tax_rate': 0.25
+    },
+    'pessimistic_case': {
+        'purchase_price': 160000,
+        'financing_mix': {'debt': 0.7, 'equity': 0.3},
+        'synergies': {'cost_savings': 5000, 'revenue_growth': 2000},
+        'transaction_costs': 6000,
+        'tax_rate': 0.25
+    }
+}
+
+@pytest.fixture
+def combined_bs() -> pd.DataFrame:
+    """Combined sample balance sheet, including an account outside the metrics."""
+    return pd.DataFrame({
+        'Account': [
+            'Cash and Cash Equivalents',
+            'Accounts Receivable',
+            'Inventory',
+            'Property Plant & Equipment',
+            'Goodwill',
+            'Accounts Payable',
+            'Short-Term Debt',
+            'Long-Term Debt',
+            'Shareholders\' Equity',
+            'Deferred Tax Liability'
+        ],
+        'Amount': [
+            70000.0, 45000.0, 30000.0, 150000.0, 12500.0,
+            37000.0, 20000.0, 100000.0, 130000.0, 5000.0
+        ]
+    })
+
+def test_batch_adjustments_match_scalar(combined_bs: pd.DataFrame) -> None:
+    manager = ScenarioManager(SCENARIOS)
+    batch = manager.apply_all_scenario_adjustments(combined_bs)
+    
+    assert batch.shape == (len(SCENARIOS), len(combined_bs))
+    for i, scenario_name in enumerate(SCENARIOS):
+        manager.set_scenario(scenario_name)
+        scalar = manager.apply_scenario_adjustments(combined_bs)
+        
+        assert scalar['Account'].tolist() == combined_bs['Account'].tolist()
+        np.testing.assert_allclose(batch[i], scalar['Amount'].to_numpy(dtype=float))
+
+def test_batch_metrics_match_scalar(combined_bs: pd.DataFrame) -> None:
+    manager = ScenarioManager(SCENARIOS)
+    batch = manager.calculate_all_metrics(
+        combined_bs['Account'],
+        manager.apply_all_scenario_adjustments(combined_bs)
+    )
+    
+    for i, scenario_name in enumerate(SCENARIOS):
+        manager.set_scenario(scenario_name)
+        scalar = manager.calculate_metrics(manager.apply_scenario_adjustments(combined_bs))
+        
+        assert set(batch) == set(scalar)
+        for name, value in scalar.items():
+            assert batch[name][i] == pytest.approx(value)